@@ -0,0 +1,255 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+connect_four_core.pyx
+Compiled drop‑in for connect_four_logic.ConnectFour.
+
+Same rules, game‑play and search API as the pure‑Python engine (drop_piece,
+is_win, can_drop, available_moves, can_win_in_next_move, zhash, state_key,
+clone, board, height, flags, ...), but the bitboards and column heights live
+in C fields so the hot paths run without interpreter dispatch.
+
+Differences from connect_four_logic.ConnectFour:
+
+* ``height`` is an immutable ``bytes`` snapshot, not the live bytearray;
+* ``any_four_in_a_row``, ``WIN_MASKS`` and ``is_winning_pos`` are not
+  provided – use connect_four_logic for numpy batch analysis.
+
+Build in place (needs Cython and a C compiler):
+
+    cythonize -i connect_four_core.pyx
+
+If the extension is not built, the GUI falls back to connect_four_logic.
+"""
+
+from libc.stdint cimport uint8_t, uint64_t
+
+import numpy as np
+
+from connect_four_logic import ConnectFour as _PyConnectFour
+
+
+cdef int ROWS = 6
+cdef int COLS = 7
+cdef int H1 = ROWS + 1  # bits per column in the bitboards (one sentinel)
+
+# Zobrist keys, indexed [row][col][player - 1]; copied from the pure‑Python
+# engine so both builds hash the same position to the same value
+cdef uint64_t ZOBRIST[6][7][2]
+
+
+cdef void _load_zobrist():
+    cdef int r, c, p
+    keys = _PyConnectFour._ZOBRIST
+    for r in range(ROWS):
+        for c in range(COLS):
+            for p in range(2):
+                ZOBRIST[r][c][p] = keys[r][c][p]
+
+
+_load_zobrist()
+
+
+cdef inline bint has_won(uint64_t bits) nogil:
+    """True if *bits* contains four in a row (Tromp's shift test)."""
+    cdef uint64_t y
+    y = bits & (bits >> H1)  # horizontal
+    if y & (y >> (2 * H1)):
+        return True
+    y = bits & (bits >> (H1 - 1))  # diagonal ╲
+    if y & (y >> (2 * (H1 - 1))):
+        return True
+    y = bits & (bits >> (H1 + 1))  # diagonal ╱
+    if y & (y >> (2 * (H1 + 1))):
+        return True
+    y = bits & (bits >> 1)  # vertical
+    return (y & (y >> 2)) != 0
+
+
+cdef class ConnectFour:
+    """Compiled Connect‑Four rules engine (6 × 7 grid, 4 in a row to win)."""
+
+    ROWS = 6
+    COLS = 7
+    CONNECT = 4
+
+    EMPTY = 0
+    PLAYER1 = 1
+    PLAYER2 = 2
+
+    H1 = 7
+
+    cdef readonly uint64_t mask  # every occupied cell
+    cdef readonly uint64_t pos   # cells of the player to move
+    cdef uint8_t _height[7]      # number of discs in each column
+    cdef readonly uint64_t zhash # Zobrist hash, updated incrementally per move
+
+    # read‑only from Python, like the properties of connect_four_logic
+    cdef readonly int current_player
+    cdef public int moves_made
+    cdef readonly bint game_over
+    cdef readonly object winner  # 1, 2 or None for draw/in‑progress
+
+    cdef object _board
+
+    def __init__(self):
+        self.reset()
+
+    # --------------------------------------------------------------------- #
+    #  Public API                                                           #
+    # --------------------------------------------------------------------- #
+
+    def reset(self):
+        """Start a fresh game."""
+        cdef int c
+        self.mask = 0
+        self.pos = 0
+        for c in range(COLS):
+            self._height[c] = 0
+        self.zhash = 0
+        self._board = None
+        self.current_player = 1
+        self.moves_made = 0
+        self.game_over = False
+        self.winner = None
+
+    def drop_piece(self, int col):
+        """
+        Drop a piece for the current player into *col* (0‑based).
+
+        Returns the (row, col) where the disc landed, with row 0 at the top.
+        Raises ValueError for illegal columns or full columns.
+        Raises RuntimeError if the game has already finished.
+        """
+        cdef int h
+        if self.game_over:
+            raise RuntimeError("The game is already finished.")
+
+        if not 0 <= col < COLS:
+            raise ValueError(f"Column must be between 0 and {COLS - 1}.")
+
+        h = self._height[col]
+        if h == ROWS:
+            raise ValueError("That column is full.")
+
+        # place the disc: after the swap *pos* belongs to the opponent
+        self.pos ^= self.mask
+        self.mask |= (<uint64_t>1) << (H1 * col + h)
+        self._height[col] = h + 1
+        self.moves_made += 1
+        self._board = None
+        self.zhash ^= ZOBRIST[ROWS - 1 - h][col][self.current_player - 1]
+
+        # check for a winning move (nobody can have four discs before the
+        # mover's fourth, i.e. the 7th disc overall)
+        if self.moves_made >= 7 and has_won(self.pos ^ self.mask):
+            self.game_over = True
+            self.winner = self.current_player
+        elif self.moves_made == ROWS * COLS:
+            self.game_over = True  # draw
+        else:
+            # swap turns
+            self.current_player = 3 - self.current_player
+
+        return ROWS - 1 - h, col
+
+    def is_win(self):
+        """True if the last disc dropped completed four in a row."""
+        # the disc just played belongs to the side that is *not* in pos
+        return has_won(self.pos ^ self.mask)
+
+    def can_drop(self, int col):
+        """True if the game is running and *col* is on the board and not full."""
+        return not self.game_over and 0 <= col < COLS and self._height[col] < ROWS
+
+    def available_moves(self):
+        """Columns that can still take a disc (none once the game is over)."""
+        cdef int c
+        if self.game_over:
+            return []
+        return [c for c in range(COLS) if self._height[c] < ROWS]
+
+    def can_win_in_next_move(self):
+        """True if the current player has a drop that wins immediately."""
+        cdef int c
+        if self.game_over:
+            return False
+        # *pos* already holds the current player's discs
+        for c in range(COLS):
+            if self._height[c] < ROWS and has_won(
+                self.pos | (<uint64_t>1) << (H1 * c + self._height[c])
+            ):
+                return True
+        return False
+
+    def state_key(self):
+        """
+        Small hashable snapshot of the position, e.g. as the argument of a
+        ``functools.lru_cache``‑wrapped evaluator or a transposition‑table key.
+        """
+        return self.mask, self.pos, self.current_player
+
+    def clone(self):
+        """Independent copy of the game for search, much cheaper than deepcopy."""
+        cdef ConnectFour c = <ConnectFour>type(self).__new__(type(self))
+        cdef int k
+        c.mask = self.mask
+        c.pos = self.pos
+        for k in range(COLS):
+            c._height[k] = self._height[k]
+        c.zhash = self.zhash
+        c.current_player = self.current_player
+        c.moves_made = self.moves_made
+        c.game_over = self.game_over
+        c.winner = self.winner
+        c._board = None
+        return c
+
+    @property
+    def height(self):
+        """Number of discs in each column, as a read‑only bytes snapshot."""
+        return bytes(self._height[:COLS])
+
+    @property
+    def flags(self):
+        """
+        Side to move, game‑over and winner packed like connect_four_logic:
+        bit 0 = side to move, bit 1 = game over, bits 2‑3 = winner.
+        """
+        return (
+            (self.current_player - 1)
+            | (<int>self.game_over) << 1
+            | (self.winner or 0) << 2
+        )
+
+    @property
+    def board(self):
+        """The position as a (ROWS × COLS) numpy array, row 0 at the top."""
+        cdef int c, h, to_move
+        cdef uint64_t bit
+        if self._board is None:
+            board = np.zeros((ROWS, COLS), dtype=np.uint8)
+            # *pos* holds the discs of whoever moves next
+            to_move = 1 if self.moves_made % 2 == 0 else 2
+            for c in range(COLS):
+                for h in range(self._height[c]):
+                    bit = (<uint64_t>1) << (H1 * c + h)
+                    board[ROWS - 1 - h, c] = (
+                        to_move if self.pos & bit else 3 - to_move
+                    )
+            self._board = board
+        return self._board
+
+    # --------------------------------------------------------------------- #
+    #  Convenience                                                          #
+    # --------------------------------------------------------------------- #
+
+    @property
+    def is_draw(self):
+        """True if the game ended without a winner."""
+        return self.game_over and self.winner is None
+
+    def __str__(self):
+        return np.array_str(self.board)
+
+    def __getitem__(self, idx):
+        return self.board[idx]
@@ -4,7 +4,10 @@
 
 import tkinter as tk
 
-from connect_four_logic import ConnectFour
+try:  # compiled engine, if connect_four_core.pyx has been built
+    from connect_four_core import ConnectFour
+except ImportError:
+    from connect_four_logic import ConnectFour
 
 # ──────────────────────────────────────────────────────────────────────
 #  GUI constants
@@ -58,11 +61,10 @@ class ConnectFourGUI:
             return
 
         col = event.x // CELL_SIZE
-        try:
-            row, col = self.engine.drop_piece(col)
-        except ValueError:
+        if not self.engine.can_drop(col):
             # illegal column or column full – just ignore the click
             return
+        row, col = self.engine.drop_piece(col)
 
         self._draw_disc(row, col)
         self._update_status()
@@ -70,7 +72,9 @@ class ConnectFourGUI:
     def new_game(self) -> None:
         """Reset the board and start over."""
         self.engine.reset()
-        self.canvas.delete("disc")   # remove every previously drawn disc
+        # blank every hole again in one Tcl call – the ovals are reused
+        self.canvas.itemconfigure("hole", fill=COLOR_EMPTY, width=0)
+        self.canvas.update_idletasks()
         self._update_status()
 
     # ──────────────────────────────────────────────────────────────────
@@ -82,16 +86,29 @@ class ConnectFourGUI:
         h = ConnectFour.ROWS * CELL_SIZE
         self.canvas.create_rectangle(0, 0, w, h, fill=COLOR_BG, width=0)
 
-        for r in range(ConnectFour.ROWS):
-            for c in range(ConnectFour.COLS):
-                self._draw_hole(r, c)
-
-    def _draw_hole(self, r: int, c: int) -> None:
-        x0 = c * CELL_SIZE + DISC_OUTLINE
-        y0 = r * CELL_SIZE + DISC_OUTLINE
-        x1 = x0 + CELL_SIZE - 2 * DISC_OUTLINE
-        y1 = y0 + CELL_SIZE - 2 * DISC_OUTLINE
-        self.canvas.create_oval(x0, y0, x1, y1, fill=COLOR_EMPTY, width=0)
+        # oval bounding boxes, indexed [row][col]
+        self._hole_coords = [
+            [
+                (
+                    c * CELL_SIZE + DISC_OUTLINE,
+                    r * CELL_SIZE + DISC_OUTLINE,
+                    (c + 1) * CELL_SIZE - DISC_OUTLINE,
+                    (r + 1) * CELL_SIZE - DISC_OUTLINE,
+                )
+                for c in range(ConnectFour.COLS)
+            ]
+            for r in range(ConnectFour.ROWS)
+        ]
+        # one canvas item per hole; discs are drawn by recolouring it
+        self._oval_ids = [
+            [self._draw_hole(r, c) for c in range(ConnectFour.COLS)]
+            for r in range(ConnectFour.ROWS)
+        ]
+
+    def _draw_hole(self, r: int, c: int) -> int:
+        return self.canvas.create_oval(
+            *self._hole_coords[r][c], fill=COLOR_EMPTY, width=0, tags="hole"
+        )
 
     def _draw_disc(self, row: int, col: int) -> None:
         """
@@ -99,16 +116,11 @@ class ConnectFourGUI:
         so we draw it the same way here – the engine already gives us the
         bottom‑most free row first, which is exactly what we want.**
         """
-        x0 = col * CELL_SIZE + DISC_OUTLINE
-        y0 = row * CELL_SIZE + DISC_OUTLINE
-        x1 = x0 + CELL_SIZE - 2 * DISC_OUTLINE
-        y1 = y0 + CELL_SIZE - 2 * DISC_OUTLINE
-
         piece = int(self.engine.board[row, col])
         color = COLOR_P1 if piece == ConnectFour.PLAYER1 else COLOR_P2
 
-        self.canvas.create_oval(
-            x0, y0, x1, y1, fill=color, width=DISC_OUTLINE, tags="disc"
+        self.canvas.itemconfig(
+            self._oval_ids[row][col], fill=color, width=DISC_OUTLINE
         )
 
     # ──────────────────────────────────────────────────────────────────
@@ -25,6 +25,16 @@ if game.game_over:
 from __future__ import annotations
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional – the kernels then run as plain Python
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
 
 
 class ConnectFour:
@@ -38,13 +48,34 @@ class ConnectFour:
     PLAYER1: int = 1
     PLAYER2: int = 2
 
+    H1: int = ROWS + 1  # bits per column in the bitboards (one sentinel)
+    _EMPTY_HEIGHTS: bytes = bytes(COLS)
+
+    # bit layout of self.flags
+    _TURN: int = 0b0001        # 0 = PLAYER1 to move, 1 = PLAYER2
+    _GAME_OVER: int = 0b0010
+    _WINNER_SHIFT: int = 2     # bits 2‑3: 0 = none, else the winning player
+
+    # Zobrist keys, indexed [row][col][player - 1]; fixed seed so hashes are
+    # stable across runs (e.g. for an on‑disk opening book)
+    _ZOBRIST: list[list[list[int]]] = (
+        np.random.default_rng(0xC4)
+        .integers(0, 2**63, size=(ROWS, COLS, 2), dtype=np.uint64)
+        .tolist()
+    )
+
     def __init__(self) -> None:
-        self.winner = None
-        self.game_over = None
+        self.flags = None
         self.moves_made = None
-        self.current_player = None
-        self._next_row = None
-        self.board = None
+        self.mask = None
+        self.pos = None
+        self.zhash = None
+        # buffers are allocated once and cleared in place by reset()
+        self.height: bytearray = bytearray(self.COLS)  # discs per column
+        self._board: np.ndarray | None = np.zeros(
+            (self.ROWS, self.COLS), dtype=np.uint8
+        )
+        self._board_stale = None
         self.reset()
 
     # --------------------------------------------------------------------- #
@@ -53,94 +84,196 @@ class ConnectFour:
 
     def reset(self) -> None:
         """Start a fresh game."""
-        self.board: np.ndarray = np.zeros((self.ROWS, self.COLS), dtype=int)
-        # index of the next empty row in each column (‑1 means column full)
-        self._next_row: dict[int, int] = {c: self.ROWS - 1 for c in range(self.COLS)}
-        self.current_player: int = self.PLAYER1
+        # Bitboards in the column-major layout: column c occupies bits
+        # 7*c .. 7*c+5 (bottom to top), bit 7*c+6 is an always-empty sentinel.
+        self.mask: int = 0  # every occupied cell
+        self.pos: int = 0   # cells of the player to move
+        self.height[:] = self._EMPTY_HEIGHTS
+        # Zobrist hash of the position, updated incrementally per move
+        self.zhash: int = 0
+        # lazily refilled numpy view (clones may not have a buffer yet)
+        self._board_stale: bool = True
+        # side to move, game‑over and winner packed into one int
+        self.flags: int = 0
         self.moves_made: int = 0
-        self.game_over: bool = False
-        self.winner: int | None = None  # 1, 2 or None for draw/in‑progress
 
     def drop_piece(self, col: int) -> tuple[int, int]:
         """
         Drop a piece for the current player into *col* (0‑based).
 
-        Returns the (row, col) where the disc landed.
+        Returns the (row, col) where the disc landed, with row 0 at the top.
         Raises ValueError for illegal columns or full columns.
         Raises RuntimeError if the game has already finished.
         """
-        if self.game_over:
+        flags: int = self.flags
+        if flags & self._GAME_OVER:
             raise RuntimeError("The game is already finished.")
 
         if not 0 <= col < self.COLS:
             raise ValueError(f"Column must be between 0 and {self.COLS - 1}.")
 
-        row: int = self._next_row[col]
-        if row < 0:
+        h: int = self.height[col]
+        if h == self.ROWS:
             raise ValueError("That column is full.")
 
-        # place the disc
-        self.board[row, col] = self.current_player
-        self._next_row[col] -= 1
+        # place the disc and test for a win in one (possibly compiled) call
+        self.mask, self.pos, won = play_check(
+            self.mask, self.pos, self.height, col, self.moves_made
+        )
         self.moves_made += 1
+        self._board_stale = True
+
+        row: int = self.ROWS - 1 - h
+        turn: int = flags & self._TURN
+        self.zhash ^= self._ZOBRIST[row][col][turn]
 
-        # check for a winning move
-        if self._is_winning_move(row, col):
-            self.game_over = True
-            self.winner = self.current_player
+        if won:
+            self.flags = flags | self._GAME_OVER | (turn + 1) << self._WINNER_SHIFT
         elif self.moves_made == self.ROWS * self.COLS:
-            self.game_over = True  # draw
+            self.flags = flags | self._GAME_OVER  # draw
         else:
-            # swap turns
-            self.current_player = (
-                self.PLAYER2 if self.current_player == self.PLAYER1 else self.PLAYER1
-            )
+            self.flags = flags ^ self._TURN  # swap turns
 
         return row, col
 
-    # --------------------------------------------------------------------- #
-    #  Internals                                                            #
-    # --------------------------------------------------------------------- #
-
-    def _is_winning_move(self, row: int, col: int) -> bool:
-        """True if dropping at (row, col) finished the game."""
-        piece: int = self.board[row, col]
+    def is_win(self) -> bool:
+        """True if the last disc dropped completed four in a row."""
+        # the disc just played belongs to the side that is *not* in pos
+        return _has_won(self.pos ^ self.mask)
+
+    def can_drop(self, col: int) -> bool:
+        """True if the game is running and *col* is on the board and not full."""
+        return (
+            not self.flags & self._GAME_OVER
+            and 0 <= col < self.COLS
+            and self.height[col] < self.ROWS
+        )
+
+    def available_moves(self) -> list[int]:
+        """Columns that can still take a disc (none once the game is over)."""
+        if self.game_over:
+            return []
+        return [c for c in range(self.COLS) if self.height[c] < self.ROWS]
 
-        # direction vectors: horizontal, vertical, two diagonals
-        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
-            if self._count_consecutive(row, col, dr, dc, piece) >= self.CONNECT:
+    def can_win_in_next_move(self) -> bool:
+        """True if the current player has a drop that wins immediately."""
+        if self.game_over:
+            return False
+        # *pos* already holds the current player's discs
+        for c in range(self.COLS):
+            h: int = self.height[c]
+            if h < self.ROWS and _has_won(self.pos | 1 << (self.H1 * c + h)):
                 return True
         return False
 
-    def _count_consecutive(
-        self, row: int, col: int, dr: int, dc: int, piece: int
-    ) -> int:
+    def state_key(self) -> tuple[int, int, int]:
+        """
+        Small hashable snapshot of the position, e.g. as the argument of a
+        ``functools.lru_cache``‑wrapped evaluator or a transposition‑table key.
+        """
+        return self.mask, self.pos, self.current_player
+
+    def clone(self) -> ConnectFour:
+        """
+        Independent copy of the game for search, much cheaper than deepcopy:
+        a few int assignments plus a 7‑byte bytearray copy.  The clone's
+        numpy board view is only allocated if someone asks for it.
+        """
+        c = type(self).__new__(type(self))
+        c.mask = self.mask
+        c.pos = self.pos
+        c.height = self.height[:]
+        c.zhash = self.zhash
+        c.flags = self.flags
+        c.moves_made = self.moves_made
+        c._board = None
+        c._board_stale = True
+        return c
+
+    @property
+    def board(self) -> np.ndarray:
         """
-        Count contiguous *piece* discs through (row, col) in both directions
-        given by (dr, dc). Example: dr=1, dc=‑1 walks ↘ and ↖.
+        The position as a (ROWS × COLS) numpy array, row 0 at the top.
+
+        Refilled in place from the bitboards on first access after a move
+        (the same array is reused for the engine's lifetime – copy it if you
+        need a snapshot); the search hot path never touches it.
         """
-        count: int = 1  # include the drop point itself
+        if self._board_stale:
+            board = self._board
+            if board is None:  # clones allocate the buffer on first use
+                board = self._board = np.empty((self.ROWS, self.COLS), dtype=np.uint8)
+            board.fill(self.EMPTY)
+            # *pos* holds the discs of whoever moves next
+            to_move = self.PLAYER1 if self.moves_made % 2 == 0 else self.PLAYER2
+            other = self.PLAYER2 if to_move == self.PLAYER1 else self.PLAYER1
+            for c in range(self.COLS):
+                for h in range(self.height[c]):
+                    bit = 1 << (self.H1 * c + h)
+                    board[self.ROWS - 1 - h, c] = to_move if self.pos & bit else other
+            self._board_stale = False
+        return self._board
 
-        # forward direction
-        r, c = row + dr, col + dc
-        while 0 <= r < self.ROWS and 0 <= c < self.COLS and self.board[r, c] == piece:
-            count += 1
-            r += dr
-            c += dc
+    # --------------------------------------------------------------------- #
+    #  Batch analysis                                                       #
+    # --------------------------------------------------------------------- #
 
-        # reverse direction
-        r, c = row - dr, col - dc
-        while 0 <= r < self.ROWS and 0 <= c < self.COLS and self.board[r, c] == piece:
-            count += 1
-            r -= dr
-            c -= dc
+    @classmethod
+    def any_four_in_a_row(cls, board: np.ndarray) -> np.ndarray | bool:
+        """
+        True if either player has four in a row on *board*.
 
-        return count
+        *board* is a (ROWS × COLS) array like ``engine.board`` or a stack of
+        them with shape (..., ROWS, COLS); a stack gives one result per board.
+        All 69 windows are compared at once, so many positions can be
+        screened without a Python loop per line.
+        """
+        board = np.asarray(board)
+        windows = cls._all_windows(board)
+        won = (
+            (windows == cls.PLAYER1).all(axis=-1)
+            | (windows == cls.PLAYER2).all(axis=-1)
+        ).any(axis=-1)
+        return bool(won) if board.ndim == 2 else won
+
+    @classmethod
+    def _all_windows(cls, board: np.ndarray) -> np.ndarray:
+        """
+        Every CONNECT‑long line on *board*, shape (..., 69, CONNECT).
+
+        Horizontal and vertical lines are sliding windows along one axis;
+        diagonals are the two diagonals of every CONNECT × CONNECT block.
+        """
+        n: int = cls.CONNECT
+        lead = board.shape[:-2]
+        blocks = sliding_window_view(board, (n, n), axis=(-2, -1))
+        lines = (
+            sliding_window_view(board, n, axis=-1),  # horizontal
+            sliding_window_view(board, n, axis=-2),  # vertical
+            np.diagonal(blocks, axis1=-2, axis2=-1),  # diagonal ╲
+            np.diagonal(blocks[..., ::-1], axis1=-2, axis2=-1),  # diagonal ╱
+        )
+        return np.concatenate([w.reshape(*lead, -1, n) for w in lines], axis=-2)
 
     # --------------------------------------------------------------------- #
     #  Convenience                                                          #
     # --------------------------------------------------------------------- #
 
+    @property
+    def current_player(self) -> int:
+        """PLAYER1 or PLAYER2 – whose turn it is (the winner once decided)."""
+        return 1 + (self.flags & self._TURN)
+
+    @property
+    def game_over(self) -> bool:
+        """True once someone has won or the board is full."""
+        return bool(self.flags & self._GAME_OVER)
+
+    @property
+    def winner(self) -> int | None:
+        """1, 2 or None for draw/in‑progress."""
+        return (self.flags >> self._WINNER_SHIFT) or None
+
     @property
     def is_draw(self) -> bool:
         """True if the game ended without a winner."""
@@ -152,3 +285,114 @@ class ConnectFour:
     # Allow indexing like engine[row, col] if you really want it
     def __getitem__(self, idx):
         return self.board[idx]
+
+
+# ------------------------------------------------------------------------- #
+#  Bitboard kernels (compiled with numba when it is installed)              #
+# ------------------------------------------------------------------------- #
+
+# plain module constants, so numba can freeze them into the compiled code
+_H1: int = ConnectFour.H1
+# nobody can have four discs before the mover's fourth, i.e. the 7th overall
+_MIN_WIN_DISCS: int = 2 * ConnectFour.CONNECT - 1
+
+
+@njit(cache=True)
+def _has_won(bits: int) -> bool:
+    """
+    True if *bits* contains four in a row (Tromp's shift test).
+
+    Shifting by the distance between neighbouring cells and AND‑ing
+    twice leaves a bit set only where four such cells line up; the
+    sentinel row keeps columns from wrapping into each other.
+    """
+    y = bits & (bits >> _H1)  # horizontal
+    if y & (y >> 2 * _H1):
+        return True
+    y = bits & (bits >> (_H1 - 1))  # diagonal ╲
+    if y & (y >> 2 * (_H1 - 1)):
+        return True
+    y = bits & (bits >> (_H1 + 1))  # diagonal ╱
+    if y & (y >> 2 * (_H1 + 1)):
+        return True
+    y = bits & (bits >> 1)  # vertical
+    return (y & (y >> 2)) != 0
+
+
+@njit(cache=True)
+def play_check(
+    mask: int, pos: int, height, col: int, moves_made: int
+) -> tuple[int, int, bool]:
+    """
+    Drop a disc for the side to move into *col* and test it for a win.
+
+    Takes the bitboards and the per‑column *height* buffer of a ConnectFour
+    (a bytearray or uint8 array, updated in place) plus the number of discs
+    already played, and returns ``(new_mask, new_pos, won)``.  The win test
+    is skipped while fewer than 7 discs are on the board.  No legality
+    checks – the column must not be full.  Usable from inside other
+    ``@njit`` search code.
+    """
+    h = height[col]
+    # after the swap *pos* belongs to the opponent
+    pos ^= mask
+    mask |= 1 << (_H1 * col + h)
+    height[col] = h + 1
+    if moves_made + 1 < _MIN_WIN_DISCS:
+        return mask, pos, False
+    return mask, pos, _has_won(pos ^ mask)
+
+
+# ------------------------------------------------------------------------- #
+#  Winning‑line bitmasks                                                    #
+# ------------------------------------------------------------------------- #
+
+
+def _build_win_masks() -> tuple[int, ...]:
+    """Every four‑in‑a‑row as a bitmask in ConnectFour's bitboard layout."""
+    masks: list[int] = []
+    rows, cols, n, h1 = (
+        ConnectFour.ROWS, ConnectFour.COLS, ConnectFour.CONNECT, ConnectFour.H1
+    )
+    for c in range(cols):
+        for h in range(rows):
+            # horizontal, vertical, diagonal ╱, diagonal ╲
+            for dc, dh in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                cells = [(c + i * dc, h + i * dh) for i in range(n)]
+                if all(0 <= cc < cols and 0 <= hh < rows for cc, hh in cells):
+                    masks.append(sum(1 << (h1 * cc + hh) for cc, hh in cells))
+    return tuple(masks)
+
+
+# all 69 winning lines; public so callers can build a numpy batch check
+WIN_MASKS: tuple[int, ...] = _build_win_masks()
+
+# single‑cell bit -> the (at most 13) winning lines through that cell
+_WIN_MASKS_BY_CELL: dict[int, tuple[int, ...]] = {
+    1 << (ConnectFour.H1 * c + h): tuple(
+        m for m in WIN_MASKS if m >> (ConnectFour.H1 * c + h) & 1
+    )
+    for c in range(ConnectFour.COLS)
+    for h in range(ConnectFour.ROWS)
+}
+
+
+def is_winning_pos(pos: int, move: int = 0) -> bool:
+    """
+    True if the bitboard *pos* covers a complete winning line.
+
+    *move*, if given, must be the single bit of one on‑board cell (the disc
+    just played, ``1 << (H1 * col + height)``); only the lines through it
+    are tested.  Raises ValueError for anything else.  ConnectFour itself
+    uses the shift test, which is faster in pure Python; the mask form is
+    for callers that want to lift the check to numpy over many positions
+    at once, e.g. with ``masks = np.array(WIN_MASKS, dtype=np.uint64)``:
+    ``((pos[:, None] & masks) == masks).any(axis=1)``.
+    """
+    if not move:
+        masks = WIN_MASKS
+    else:
+        masks = _WIN_MASKS_BY_CELL.get(move)
+        if masks is None:
+            raise ValueError("move must be the bit of a single board cell.")
+    return any(pos & m == m for m in masks)
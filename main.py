@@ -9,7 +9,8 @@ you can expand this file into a simple menu that chooses which one to run.
 import tkinter as tk
 
 # Importing the GUI module automatically pulls in the logic engine,
-# because connect_four_gui.py does "from connect_four_logic import ConnectFour".
+# because connect_four_gui.py imports ConnectFour (the compiled
+# connect_four_core build if present, otherwise connect_four_logic).
 from connect_four_gui import ConnectFourGUI
 
 
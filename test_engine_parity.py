@@ -0,0 +1,72 @@
+"""
+test_engine_parity.py
+Checks that the compiled engine (connect_four_core) and the pure‑Python
+engine (connect_four_logic) agree move for move.
+
+Skipped unless the extension has been built:
+
+    cythonize -i connect_four_core.pyx
+    python -m unittest test_engine_parity
+"""
+
+import random
+import unittest
+
+import numpy as np
+
+from connect_four_logic import ConnectFour as PyConnectFour
+
+try:
+    from connect_four_core import ConnectFour as CConnectFour
+except ImportError:
+    CConnectFour = None
+
+
+@unittest.skipIf(CConnectFour is None, "connect_four_core is not built")
+class EngineParityTest(unittest.TestCase):
+    GAMES = 500
+
+    def assert_same_state(self, py, cy) -> None:
+        self.assertTrue(np.array_equal(py.board, cy.board))
+        self.assertEqual(py.zhash, cy.zhash)
+        self.assertEqual(py.state_key(), cy.state_key())
+        self.assertEqual(py.flags, cy.flags)
+        self.assertEqual(bytes(py.height), cy.height)
+        self.assertEqual(
+            (py.current_player, py.game_over, py.winner, py.is_draw),
+            (cy.current_player, cy.game_over, cy.winner, cy.is_draw),
+        )
+        self.assertEqual(py.available_moves(), cy.available_moves())
+        self.assertEqual(py.can_win_in_next_move(), cy.can_win_in_next_move())
+        self.assertEqual(py.is_win(), cy.is_win())
+        for col in range(-1, PyConnectFour.COLS + 1):
+            self.assertEqual(py.can_drop(col), cy.can_drop(col))
+
+    def test_random_games(self) -> None:
+        rng = random.Random(0)
+        py, cy = PyConnectFour(), CConnectFour()
+        for _ in range(self.GAMES):
+            py.reset()
+            cy.reset()
+            self.assert_same_state(py, cy)
+            while not py.game_over:
+                # clones must match too, and must not affect the originals
+                self.assert_same_state(py.clone(), cy.clone())
+                col = rng.choice(py.available_moves())
+                self.assertEqual(py.drop_piece(col), cy.drop_piece(col))
+                self.assert_same_state(py, cy)
+
+    def test_illegal_moves_raise_alike(self) -> None:
+        py, cy = PyConnectFour(), CConnectFour()
+        for engine in (py, cy):
+            for _ in range(PyConnectFour.ROWS):
+                engine.drop_piece(0)
+            with self.assertRaises(ValueError):
+                engine.drop_piece(0)  # full column
+            with self.assertRaises(ValueError):
+                engine.drop_piece(PyConnectFour.COLS)
+        self.assert_same_state(py, cy)
+
+
+if __name__ == "__main__":
+    unittest.main()